@@ -1,4 +1,3 @@
-import six
 import types
 
 
@@ -20,6 +19,8 @@ class Field(object):
     :param bool required: Whether the field is required. If set to ``False``,
         :meth:`Field.to_value` will not be called if the value is ``None``.
     """
+    __slots__ = ('attr', 'call', 'label', 'required', '__weakref__')
+
     #: Set to ``True`` if the value function returned from
     #: :meth:`Field.as_getter` requires the serializer to be passed in as the
     #: first argument. Otherwise, the object will be the only parameter.
@@ -52,6 +53,13 @@ class Field(object):
             return True
         return not getattr(to_value, '_serpy_base_implementation', False)
 
+    def _is_as_getter_overridden(self):
+        as_getter = self.as_getter
+        # If as_getter isn't a method, it must have been overridden.
+        if not isinstance(as_getter, types.MethodType):
+            return True
+        return not getattr(as_getter, '_serpy_base_implementation', False)
+
     def as_getter(self, serializer_field_name, serializer_cls):
         """Returns a function that fetches an attribute from an object.
 
@@ -74,25 +82,30 @@ class Field(object):
         :param serializer_cls: The :class:`Serializer` this field is a part of.
         """
         return None
+    as_getter._serpy_base_implementation = True
 
 
 class StrField(Field):
     """A :class:`Field` that converts the value to a string."""
-    to_value = staticmethod(six.text_type)
+    __slots__ = ()
+    to_value = staticmethod(str)
 
 
 class IntField(Field):
     """A :class:`Field` that converts the value to an integer."""
+    __slots__ = ()
     to_value = staticmethod(int)
 
 
 class FloatField(Field):
     """A :class:`Field` that converts the value to a float."""
+    __slots__ = ()
     to_value = staticmethod(float)
 
 
 class BoolField(Field):
     """A :class:`Field` that converts the value to a boolean."""
+    __slots__ = ()
     to_value = staticmethod(bool)
 
 
@@ -119,6 +132,8 @@ class MethodField(Field):
     :param str method: The method on the serializer to call. Defaults to
         ``'get_<field name>'``.
     """
+    __slots__ = ('method',)
+
     getter_takes_serializer = True
 
     def __init__(self, method=None, **kwargs):
@@ -1,16 +1,80 @@
 from serpy.fields import Field
+import keyword
 import operator
-import six
+import sys
+import types
+import unicodedata
+
+
+def _is_identifier(name):
+    # Identifiers in source code are NFKC normalized, so names that change
+    # under normalization can't be written as a plain attribute access.
+    return (name.isidentifier() and not keyword.iskeyword(name) and
+            unicodedata.normalize('NFKC', name) == name)
+
+
+def _indent(lines, level=1):
+    return ['    ' * level + line for line in lines]
+
+
+def _serialize_fields(self, instance, fields):
+    # The generic loop over compiled fields, used when `_serialize` is called
+    # with an explicit list of fields.
+    v = {}
+    for field in fields:
+        name, getter, to_value, call, required, pass_self = field[:6]
+        if pass_self:
+            result = getter(self, instance)
+        else:
+            try:
+                result = getter(instance)
+            except (KeyError, AttributeError):
+                if required:
+                    raise
+                else:
+                    continue
+            if required or result is not None:
+                if call:
+                    result = result()
+                if to_value:
+                    result = to_value(result)
+        v[name] = result
+
+    return v
+
+
+# A hand-written `_serialize(self, instance, fields)` is called through these
+# with the compiled fields of its serializer.
+def _serialize_one(self, instance):
+    return self._serialize(instance, self._compiled_fields)
+
+
+def _serialize_many(self, instances):
+    serialize = self._serialize
+    fields = self._compiled_fields
+    return [serialize(o, fields) for o in instances]
 
 
 class SerializerBase(Field):
     _field_map = {}
+    _compiled_field_map = {}
 
 
 def _compile_field_to_tuple(field, name, serializer_cls):
     getter = field.as_getter(name, serializer_cls)
+    attrs = key = None
     if getter is None:
-        getter = serializer_cls.default_getter(field.attr or name)
+        source = field.attr or name
+        getter = serializer_cls.default_getter(source)
+        if isinstance(source, str):
+            source = sys.intern(source)
+        # Attributes fetched with `attrgetter` or a key fetched with
+        # `itemgetter` can be read directly instead of calling the getter. A
+        # dotted path is split into the names of each attribute on the way.
+        if serializer_cls.default_getter is operator.attrgetter:
+            attrs = tuple(map(sys.intern, source.split('.')))
+        elif serializer_cls.default_getter is operator.itemgetter:
+            key = source
 
     # Only set a to_value function if it has been overridden for performance.
     to_value = None
@@ -19,9 +83,153 @@ def _compile_field_to_tuple(field, name, serializer_cls):
 
     # Set the field name to a supplied label; defaults to the attribute name.
     name = field.label or name
+    # The name is used as a key in every serialized dict, so intern it.
+    if isinstance(name, str):
+        name = sys.intern(name)
 
     return (name, getter, to_value, field.call, field.required,
-            field.getter_takes_serializer)
+            field.getter_takes_serializer, attrs, key)
+
+
+def _compile_serialize(serializer_cls):
+    """Generate a ``_serialize`` method specialized for ``serializer_cls``.
+
+    Each field is turned into a straight-line block of code, so looking up the
+    compiled field and branching on its options happens once here instead of
+    once per serialized object. Only optional fields are guarded against
+    missing values, and attributes and keys are read directly from the
+    object. Getters and ``to_value`` functions are passed in through a
+    default argument and unpacked into locals.
+
+    The generated ``_serialize`` still accepts the ``fields`` argument of the
+    generic implementation, and falls back to it when ``fields`` is passed.
+    """
+    getters = serializer_cls._getters
+    to_values = serializer_cls._to_values
+    calls = serializer_cls._calls
+    requireds = serializer_cls._requireds
+    pass_selfs = serializer_cls._pass_selfs
+    attrs = serializer_cls._attrs
+    keys = serializer_cls._keys
+
+    refs = []
+    consts = []
+    # Fields that are always set are split from the ones that may be missing.
+    # The leading run of always-set fields is built as a single dict display,
+    # the rest are set one by one in declaration order.
+    display = []
+    lines = []
+
+    def bind(prefix, i, value):
+        ref = '{0}{1}'.format(prefix, i)
+        refs.append(ref)
+        consts.append(value)
+        return ref
+
+    for i, name in enumerate(serializer_cls._names):
+        key = bind('n', i, name)
+
+        if pass_selfs[i]:
+            expr = '{0}(self, instance)'.format(bind('g', i, getters[i]))
+        else:
+            if keys[i] is not None:
+                item = bind('k', i, keys[i])
+                fetch = 'instance[{0}]'.format(item)
+            elif attrs[i] is None:
+                fetch = '{0}(instance)'.format(bind('g', i, getters[i]))
+            else:
+                fetch = 'instance'
+                for j, attr in enumerate(attrs[i]):
+                    if _is_identifier(attr):
+                        fetch = '{0}.{1}'.format(fetch, attr)
+                    else:
+                        fetch = 'getattr({0}, {1})'.format(
+                            fetch, bind('a', '{0}_{1}'.format(i, j), attr))
+
+            # `value` is a template applying `call` and `to_value` to a value.
+            value = '{0}'
+            if calls[i]:
+                value = '{0}()'
+            to_value = to_values[i]
+            if isinstance(to_value, types.MethodType):
+                # Call the function of a bound method with its instance, so
+                # the call doesn't have to go through the method object.
+                value = '{0}({1}, {2})'.format(
+                    bind('t', i, to_value.__func__),
+                    bind('f', i, to_value.__self__), value)
+            elif to_value:
+                value = '{0}({1})'.format(bind('t', i, to_value), value)
+
+            if requireds[i]:
+                expr = value.format(fetch)
+            else:
+                store = []
+                if value != '{0}':
+                    store.append('if result is not None:')
+                    store.append('    result = {0}'.format(
+                        value.format('result')))
+                store.append('v[{0}] = result'.format(key))
+                guarded = [
+                    'try:',
+                    '    result = {0}'.format(fetch),
+                    'except (KeyError, AttributeError):',
+                    '    pass',
+                    'else:',
+                ] + _indent(store)
+
+                if keys[i] is None:
+                    lines.extend(guarded)
+                else:
+                    # Look a key up in a plain dict before reading it, so
+                    # missing keys don't raise. Other objects may handle
+                    # missing keys themselves, e.g. with `__missing__`, or not
+                    # support `in` at all, so they are read as before.
+                    lines.append('if type(instance) is dict:')
+                    lines.append('    if {0} in instance:'.format(item))
+                    lines.extend(_indent(
+                        ['result = {0}'.format(fetch)] + store, 2))
+                    lines.append('else:')
+                    lines.extend(_indent(guarded))
+                continue
+
+        if lines:
+            lines.append('v[{0}] = {1}'.format(key, expr))
+        else:
+            display.append('    {0}: {1},'.format(key, expr))
+
+    unpack = ['    {0}, = _f'.format(', '.join(refs))] if refs else []
+    source = ['def _serialize(self, instance, fields=None, _f=_consts):']
+    source.append('    if fields is not None:')
+    source.append('        return _serialize_fields(self, instance, fields)')
+    source.extend(unpack)
+    source.extend(_indent(['v = {'] + display + ['}'] + lines + ['return v']))
+
+    # `_serialize_many` inlines the same code into a loop over all instances.
+    source.append('def _serialize_many(self, instances, _f=_consts):')
+    source.extend(unpack)
+    if lines:
+        source.append('    data = []')
+        source.append('    append = data.append')
+        source.append('    for instance in instances:')
+        source.extend(_indent(
+            ['v = {'] + display + ['}'] + lines + ['append(v)'], 2))
+        source.append('    return data')
+    else:
+        source.extend(_indent(
+            ['return [{'] + display + ['} for instance in instances]']))
+
+    namespace = {
+        '_consts': tuple(consts),
+        '_serialize_fields': _serialize_fields,
+    }
+    code = compile('\n'.join(source) + '\n',
+                   '<serpy:{0}>'.format(serializer_cls.__name__), 'exec')
+    exec(code, namespace)
+    serialize = namespace['_serialize']
+    serialize._serpy_generated = True
+    serialize_many = namespace['_serialize_many']
+    serialize_many._serpy_generated = True
+    return serialize, serialize_many
 
 
 class SerializerMeta(type):
@@ -29,8 +237,10 @@ class SerializerMeta(type):
     @staticmethod
     def _get_fields(direct_fields, serializer_cls):
         field_map = {}
-        # Get all the fields from base classes.
-        for cls in serializer_cls.__mro__[::-1]:
+        # Get all the fields from base classes. The field map of each base
+        # already holds everything it inherited, so only the direct bases
+        # need to be merged.
+        for cls in serializer_cls.__bases__[::-1]:
             if issubclass(cls, SerializerBase):
                 field_map.update(cls._field_map)
         field_map.update(direct_fields)
@@ -38,10 +248,25 @@ class SerializerMeta(type):
 
     @staticmethod
     def _compile_fields(field_map, serializer_cls):
-        return [
-            _compile_field_to_tuple(field, name, serializer_cls)
-            for name, field in field_map.items()
-        ]
+        # A field inherited unchanged from a base with the same default getter
+        # compiles to the same tuple, so reuse the one compiled for the base.
+        # Fields with their own `as_getter` may depend on the class itself.
+        inherited = {}
+        for cls in serializer_cls.__mro__[:0:-1]:
+            if (issubclass(cls, SerializerBase) and
+                    getattr(cls, 'default_getter', None) is
+                    serializer_cls.default_getter):
+                for name, compiled_field in cls._compiled_field_map.items():
+                    inherited[name] = (cls._field_map[name], compiled_field)
+
+        compiled_field_map = {}
+        for name, field in field_map.items():
+            base_field, compiled_field = inherited.get(name, (None, None))
+            if base_field is not field or field._is_as_getter_overridden():
+                compiled_field = _compile_field_to_tuple(
+                    field, name, serializer_cls)
+            compiled_field_map[name] = compiled_field
+        return compiled_field_map
 
     @staticmethod
     def _get_implicit_fields(model_fields, fields, exclude):
@@ -67,15 +292,18 @@ class SerializerMeta(type):
     def __new__(cls, name, bases, attrs):
         # Fields declared directly on the class.
         direct_fields = {}
+        # The remaining attributes the class is created with.
+        class_attrs = {}
 
-        # Take all the Fields from the attributes.
-        for attr_name, field in attrs.items():
-            if isinstance(field, Field):
-                direct_fields[attr_name] = field
-        for k in direct_fields.keys():
-            del attrs[k]
+        # Take all the Fields from the attributes in a single pass.
+        for attr_name, value in attrs.items():
+            if isinstance(value, Field):
+                direct_fields[attr_name] = value
+            else:
+                class_attrs[attr_name] = value
 
-        real_cls = super(SerializerMeta, cls).__new__(cls, name, bases, attrs)
+        real_cls = super(SerializerMeta, cls).__new__(
+            cls, name, bases, class_attrs)
 
         # Handle `Class Meta:` declarations inside custom serializer class.
         # Mimics DRF's ModelSerializer class.
@@ -132,14 +360,37 @@ class SerializerMeta(type):
                 )
 
         field_map = cls._get_fields(direct_fields, real_cls)
-        compiled_fields = cls._compile_fields(field_map, real_cls)
+        compiled_field_map = cls._compile_fields(field_map, real_cls)
+        compiled_fields = tuple(compiled_field_map.values())
 
         real_cls._field_map = field_map
-        real_cls._compiled_fields = tuple(compiled_fields)
+        real_cls._compiled_field_map = compiled_field_map
+        real_cls._compiled_fields = compiled_fields
+
+        # Also store the compiled fields column by column, so each attribute of
+        # the fields can be read as one flat tuple.
+        (real_cls._names, real_cls._getters, real_cls._to_values,
+         real_cls._calls, real_cls._requireds, real_cls._pass_selfs,
+         real_cls._attrs, real_cls._keys) = (
+            tuple(zip(*compiled_fields)) or ((),) * 8)
+
+        # Only replace `_serialize` if it has not been overridden by hand.
+        # Otherwise `_serialize_one` and `_serialize_many` have to call the
+        # overridden version with the compiled fields.
+        serialize = getattr(real_cls, '_serialize', None)
+        serialize_many = getattr(real_cls, '_serialize_many', None)
+        if serialize is None or getattr(serialize, '_serpy_generated', False):
+            (real_cls._serialize,
+             real_cls._serialize_many) = _compile_serialize(real_cls)
+            real_cls._serialize_one = real_cls._serialize
+        else:
+            real_cls._serialize_one = _serialize_one
+            if getattr(serialize_many, '_serpy_generated', False):
+                real_cls._serialize_many = _serialize_many
         return real_cls
 
 
-class Serializer(six.with_metaclass(SerializerMeta, SerializerBase)):
+class Serializer(SerializerBase, metaclass=SerializerMeta):
     """:class:`Serializer` is used as a base for custom serializers.
 
     The :class:`Serializer` class is also a subclass of :class:`Field`, and can
@@ -176,35 +427,19 @@ class Serializer(six.with_metaclass(SerializerMeta, SerializerBase)):
         self.instance = instance
         self.many = many
         self._data = None
-
-    def _serialize(self, instance, fields):
-        v = {}
-        for name, getter, to_value, call, required, pass_self in fields:
-            if pass_self:
-                result = getter(self, instance)
+        # Unless a subclass overrides `to_value`, use the serialize method for
+        # one or many objects as `to_value` directly. This saves a call and
+        # the `many` check each time `.data` or `to_value` is used.
+        if type(self).to_value is Serializer.to_value:
+            if many:
+                self.to_value = self._serialize_many
             else:
-                try:
-                    result = getter(instance)
-                except (KeyError, AttributeError):
-                    if required:
-                        raise
-                    else:
-                        continue
-                if required or result is not None:
-                    if call:
-                        result = result()
-                    if to_value:
-                        result = to_value(result)
-            v[name] = result
-
-        return v
+                self.to_value = self._serialize_one
 
     def to_value(self, instance):
-        fields = self._compiled_fields
         if self.many:
-            serialize = self._serialize
-            return [serialize(o, fields) for o in instance]
-        return self._serialize(instance, fields)
+            return self._serialize_many(instance)
+        return self._serialize_one(instance)
 
     @property
     def data(self):
@@ -16,15 +16,14 @@ setup(
     author='Clark DuVall',
     author_email='clark.duvall@gmail.com',
     license='MIT',
-    install_requires=['six'],
+    python_requires='>=3.4',
     test_suite='tests',
     classifiers=[
         'Development Status :: 4 - Beta',
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
         'Programming Language :: Python :: 3.4',
         'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
@@ -2,6 +2,7 @@ from .obj import Obj
 from serpy.fields import (
     Field, MethodField, BoolField, IntField, FloatField, StrField)
 import unittest
+import weakref
 
 
 class TestFields(unittest.TestCase):
@@ -26,6 +27,22 @@ class TestFields(unittest.TestCase):
         field = IntField()
         self.assertTrue(field._is_to_value_overridden())
 
+    def test_is_as_getter_overridden(self):
+        class GetterField(Field):
+            def as_getter(self, serializer_field_name, serializer_cls):
+                return None
+
+        self.assertFalse(Field()._is_as_getter_overridden())
+        self.assertFalse(IntField()._is_as_getter_overridden())
+        self.assertTrue(GetterField()._is_as_getter_overridden())
+        self.assertTrue(MethodField()._is_as_getter_overridden())
+
+    def test_slots(self):
+        for field in (Field(), StrField(), IntField(), FloatField(),
+                      BoolField(), MethodField()):
+            self.assertFalse(hasattr(field, '__dict__'))
+            self.assertIs(weakref.ref(field)(), field)
+
     def test_str_field(self):
         field = StrField()
         self.assertEqual(field.to_value('a'), 'a')
@@ -1,6 +1,8 @@
 from .obj import Obj
 from serpy.fields import Field, MethodField, IntField, FloatField, StrField
 from serpy.serializer import Serializer, DictSerializer
+from sys import intern
+import collections
 import unittest
 
 
@@ -47,6 +49,44 @@ class TestSerializer(unittest.TestCase):
         self.assertEqual(data['b'], 'hello')
         self.assertEqual(data['c'], 100)
 
+    def test_diamond_inheritance(self):
+        class ASerializer(Serializer):
+            a = Field()
+
+        class BSerializer(ASerializer):
+            b = Field()
+
+        class CSerializer(ASerializer):
+            a = Field(attr='c')
+
+        class DSerializer(BSerializer, CSerializer):
+            pass
+
+        data = DSerializer(Obj(a=1, b=2, c=3)).data
+        self.assertEqual(data, {'a': 1, 'b': 2})
+
+    def test_inherited_fields_reused(self):
+        class ASerializer(Serializer):
+            a = Field()
+            b = MethodField()
+
+            def get_b(self, obj):
+                return 'a'
+
+        class BSerializer(ASerializer):
+            def get_b(self, obj):
+                return 'b'
+
+        class CSerializer(ASerializer, DictSerializer):
+            pass
+
+        self.assertIs(BSerializer._compiled_field_map['a'],
+                      ASerializer._compiled_field_map['a'])
+        self.assertIsNot(CSerializer._compiled_field_map['a'],
+                         ASerializer._compiled_field_map['a'])
+        self.assertEqual(ASerializer(Obj(a=1)).data, {'a': 1, 'b': 'a'})
+        self.assertEqual(BSerializer(Obj(a=1)).data, {'a': 1, 'b': 'b'})
+
     def test_many(self):
         class ASerializer(Serializer):
             a = Field()
@@ -60,6 +100,19 @@ class TestSerializer(unittest.TestCase):
         self.assertEqual(data[3]['a'], 3)
         self.assertEqual(data[4]['a'], 4)
 
+    def test_many_optional(self):
+        class ASerializer(Serializer):
+            a = Field()
+            b = IntField(required=False)
+
+        objs = [Obj(a=1, b='2'), Obj(a=3), Obj(a=4, b=None)]
+        data = ASerializer(objs, many=True).data
+        self.assertEqual(data, [
+            {'a': 1, 'b': 2},
+            {'a': 3},
+            {'a': 4, 'b': None},
+        ])
+
     def test_serializer_as_field(self):
         class ASerializer(Serializer):
             a = Field()
@@ -84,6 +137,49 @@ class TestSerializer(unittest.TestCase):
         self.assertEqual(b_data[1]['a'], 1)
         self.assertEqual(b_data[2]['a'], 2)
 
+    def test_serializer_to_value_overridden(self):
+        class ASerializer(Serializer):
+            a = Field()
+
+            def to_value(self, instance):
+                data = super(ASerializer, self).to_value(instance)
+                return {'wrapped': data}
+
+        class BSerializer(Serializer):
+            b = ASerializer(many=True)
+
+        b = Obj(b=[Obj(a=1)])
+        self.assertEqual(BSerializer(b).data, {'b': {'wrapped': [{'a': 1}]}})
+        self.assertEqual(ASerializer(Obj(a=1)).data, {'wrapped': {'a': 1}})
+
+    def test_serializer_to_value_per_instance(self):
+        class ASerializer(Serializer):
+            a = Field()
+
+        class BSerializer(ASerializer):
+            def to_value(self, instance):
+                return super(BSerializer, self).to_value(instance)
+
+        serializer = ASerializer(Obj(a=1))
+        self.assertEqual(serializer.to_value, serializer._serialize_one)
+        serializer = ASerializer([Obj(a=1)], many=True)
+        self.assertEqual(serializer.to_value, serializer._serialize_many)
+        self.assertEqual(serializer.data, [{'a': 1}])
+        self.assertNotIn('to_value', vars(BSerializer(Obj(a=1))))
+
+    def test_nested_serializer_to_value(self):
+        class ASerializer(Serializer):
+            a = Field()
+
+        class BSerializer(Serializer):
+            one = ASerializer()
+            many = ASerializer(many=True)
+
+        fields = BSerializer._field_map
+        to_values = dict(zip(BSerializer._names, BSerializer._to_values))
+        self.assertEqual(to_values['one'], fields['one']._serialize_one)
+        self.assertEqual(to_values['many'], fields['many']._serialize_many)
+
     def test_serializer_as_field_call(self):
         class ASerializer(Serializer):
             a = Field()
@@ -140,6 +236,37 @@ class TestSerializer(unittest.TestCase):
         data = ASerializer(o).data
         self.assertEqual(data['a'], 2)
 
+    def test_attr_not_identifier(self):
+        class ASerializer(Serializer):
+            a = Field(attr='class')
+            b = IntField(attr='b-c')
+            c = Field(attr='d e', required=False)
+
+        o = Obj(**{'class': 1, 'b-c': '2'})
+        data = ASerializer(o).data
+        self.assertEqual(data, {'a': 1, 'b': 2})
+
+    def test_attr_non_ascii(self):
+        class ASerializer(Serializer):
+            a = Field(attr='caf\xe9')
+            b = Field(attr='\ufb01')
+
+        o = Obj(**{'caf\xe9': 1, '\ufb01': 2, 'fi': 3})
+        data = ASerializer(o).data
+        self.assertEqual(data, {'a': 1, 'b': 2})
+        names = ASerializer._serialize.__code__.co_names
+        self.assertIn('caf\xe9', names)
+        self.assertNotIn('fi', names)
+
+    def test_dotted_attr_not_identifier(self):
+        class ASerializer(Serializer):
+            a = Field('a.b-c.d')
+            b = Field('a.missing.d', required=False)
+
+        o = Obj(a=Obj(**{'b-c': Obj(d=2)}))
+        data = ASerializer(o).data
+        self.assertEqual(data, {'a': 2})
+
     def test_custom_field(self):
         class Add5Field(Field):
             def to_value(self, value):
@@ -190,6 +317,36 @@ class TestSerializer(unittest.TestCase):
         with self.assertRaises(KeyError):
             ASerializer({}).data
 
+    def test_optional_field_dictserializer_missing(self):
+        class ASerializer(DictSerializer):
+            a = IntField(required=False)
+
+        data = ASerializer({'a': '5'}).data
+        self.assertEqual(data, {'a': 5})
+
+        # Mappings other than dict may still return values for missing keys.
+        data = ASerializer(collections.defaultdict(lambda: '3')).data
+        self.assertEqual(data, {'a': 3})
+
+    def test_optional_field_dictserializer_getitem_only(self):
+        # `in` falls back to iterating with `__getitem__` on such objects.
+        class GetOnly(object):
+            def __init__(self, d):
+                self.d = d
+
+            def __getitem__(self, key):
+                return self.d[key]
+
+        class ASerializer(DictSerializer):
+            a = IntField()
+            b = IntField(required=False)
+
+        data = ASerializer(GetOnly({'a': 1, 'b': 2})).data
+        self.assertEqual(data, {'a': 1, 'b': 2})
+
+        data = ASerializer(GetOnly({'a': 1})).data
+        self.assertEqual(data, {'a': 1})
+
     def test_optional_field(self):
         class ASerializer(Serializer):
             a = Field(required=False)
@@ -238,6 +395,51 @@ class TestSerializer(unittest.TestCase):
         data = ASerializer(o).data
         self.assertIsNone(data['a'])
 
+    def test_optional_field_call(self):
+        class ASerializer(Serializer):
+            a = IntField(required=False, call=True)
+
+        data = ASerializer(Obj(a=lambda: '5')).data
+        self.assertEqual(data['a'], 5)
+
+        data = ASerializer(Obj(a=None)).data
+        self.assertIsNone(data['a'])
+
+        data = ASerializer(Obj()).data
+        self.assertNotIn('a', data)
+
+    def test_serialize_overridden(self):
+        class ASerializer(Serializer):
+            a = Field()
+
+            def _serialize(self, instance, fields):
+                return {'overridden': instance.a, 'n': len(fields)}
+
+        class BSerializer(ASerializer):
+            b = Field()
+
+        class CSerializer(Serializer):
+            a = Field()
+            b = Field(required=False)
+
+            def _serialize(self, instance, fields):
+                v = super(CSerializer, self)._serialize(instance, fields)
+                v['overridden'] = True
+                return v
+
+        class DSerializer(Serializer):
+            c = CSerializer()
+
+        o = Obj(a=5, b=6)
+        self.assertEqual(ASerializer(o).data, {'overridden': 5, 'n': 1})
+        self.assertEqual(BSerializer(o).data, {'overridden': 5, 'n': 2})
+        self.assertEqual(BSerializer([o], many=True).data,
+                         [{'overridden': 5, 'n': 2}])
+        self.assertEqual(CSerializer(Obj(a=5)).data,
+                         {'a': 5, 'overridden': True})
+        self.assertEqual(DSerializer(Obj(c=o)).data,
+                         {'c': {'a': 5, 'b': 6, 'overridden': True}})
+
     def test_error_on_data(self):
         with self.assertRaises(RuntimeError):
             Serializer(data='foo')
@@ -258,6 +460,14 @@ class TestSerializer(unittest.TestCase):
         self.assertIn('@content', data)
         self.assertEqual(data['@content'], 'http://baz/bar/foo/')
 
+    def test_field_names_interned(self):
+        label = ''.join(['@', 'context'])
+
+        class ASerializer(Serializer):
+            context = Field(label=label)
+
+        self.assertIs(ASerializer._names[0], intern('@context'))
+
 
 if __name__ == '__main__':
     unittest.main()